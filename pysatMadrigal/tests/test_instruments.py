@@ -17,9 +17,14 @@ import pathlib
 import pysat
 from pysat.tests.classes import cls_instrument_library as clslib
 from pysat.utils.testing import eval_bad_input
+import pytest
 
 import pysatMadrigal
 
+# The standard tests download data before loading it from the shared pysat
+# data directory, so keep them on the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group(name="madrigal_instruments")
+
 # Optional code to pass through user and password info to test instruments
 # dict, keyed by pysat instrument, with a list of usernames and passwords
 # user_info = {'platform_name': {'user': 'pysat_user',
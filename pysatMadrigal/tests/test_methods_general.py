@@ -9,16 +9,17 @@
 # ----------------------------------------------------------------------------
 """Unit tests for the general instrument methods."""
 
+import copy
 import datetime as dt
+import functools
 import gzip
 import logging
 import numpy as np
 import os
 from packaging import version
-import tempfile
+import re
 
 from madrigalWeb import madrigalWeb
-import netCDF4 as nc
 import pandas as pds
 import pysat
 from pysat.utils.testing import eval_bad_input
@@ -27,6 +28,213 @@ import xarray as xr
 
 from pysatMadrigal.instruments.methods import general
 
+# Template for the `general` kwargs, copied before each test that alters it
+_BASE_KWARGS = {'inst_code': '10', 'user': 'username', 'password': 'password',
+                'kindats': {'testing': {'tag': 1000}},
+                'supported_tags': {'testing': {'tag': 'file%Y%m%d.nc'}}}
+
+# Simple file test data, with and without a complete set of time inputs
+_DATALINES = "\n".join(["year month day hour min sec data1",
+                        "2009 1 1 0 0 0 -4.7"])
+_DATALINES_BYTES = _DATALINES.encode('utf-8')
+_BAD_TIME_DATALINES = "\n".join(["year month day hour min data1",
+                                 "2009 1 1 0 0 -4.7"])
+_BAD_TIME_DATALINES_BYTES = _BAD_TIME_DATALINES.encode('utf-8')
+
+# Known Madrigal file types and their extensions
+_FILE_TYPE_KEYS = tuple(general.file_types.keys())
+_FILE_TYPE_VALUES = tuple(general.file_types.values())
+
+# File formats for `list_files`, keyed by the pysat testing Instrument inst_id
+# and tag. These are only read by the tests.
+_LIST_SUPPORTED_TAGS = {'': {
+    '': '{{year:4d}}-{{month:02d}}-{{day:02d}}.{file_type}'}}
+
+# Deterministic NetCDF test data, shared by all temporary files
+_LAT = np.arange(40.0, 50.0, 1.0, dtype='f4')
+_LON = np.arange(-110.0, -100.0, 1.0, dtype='f4')
+_VALUE_BLOCK = np.arange(100, dtype='f4').reshape(1, 10, 10)
+
+
+@functools.lru_cache(maxsize=None)
+def gzip_bytes(data_bytes):
+    """Compress test data, reusing the output for data seen before.
+
+    Parameters
+    ----------
+    data_bytes : bytes
+        Uncompressed test data
+
+    Returns
+    -------
+    bytes
+        Test data compressed in one call using the fastest compression level
+
+    Note
+    ----
+    The general load function only reads simple files through gzip, so the
+    compression cannot be skipped even when the tests only check for errors.
+
+    """
+    return gzip.compress(data_bytes, compresslevel=1)
+
+
+def write_netcdf_files(data_path, nfiles=0):
+    """Write data to temporary NetCDF files.
+
+    Parameters
+    ----------
+    data_path : str
+        Directory in which the temporary files will be written
+    nfiles : int
+        Number of temporary NetCDF files to write (default=0)
+
+    Returns
+    -------
+    temp_files : list
+        List of temporary file names
+
+    """
+    temp_files = list()
+    for i in range(nfiles):
+        tfile = os.path.join(data_path, "temp{:d}.netCDF4".format(i))
+
+        # Build a temporary data set using the Madrigal defaults
+        ds = xr.Dataset(
+            {'value': (('timestamps', 'lat', 'lon'), _VALUE_BLOCK)},
+            coords={'timestamps': np.array([i], dtype='f4'),
+                    'lat': _LAT, 'lon': _LON})
+
+        # Set the file attributes
+        if nfiles > 1:
+            ds.attrs['catalog_text'] = "catalog text test"
+
+        # Set the default Madrigal meta data
+        for dat_name in ['lat', 'lon', 'value']:
+            ds[dat_name].attrs = {'units': 'deg',
+                                  'description': 'test data set'}
+
+        # Write the temporary file in a single call
+        ds.to_netcdf(tfile, format='NETCDF4_CLASSIC', engine='netcdf4',
+                     unlimited_dims=['timestamps'])
+
+        temp_files.append(tfile)
+
+    return temp_files
+
+
+def write_empty_files(inst, data_path, same_time=False):
+    """Create empty temporary files.
+
+    Parameters
+    ----------
+    inst : pysat.Instrument
+        Instrument whose file names are used as a base for the temporary
+        file names
+    data_path : str
+        Directory in which the temporary files will be created
+    same_time : bool
+        Use the same base filename for the temporary files with different
+        extension if True, use different base filenames if False.
+        (default=False)
+
+    Returns
+    -------
+    temp_files : list
+        List of the temporary files that were created
+
+    """
+    temp_files = list()
+    inst_files = inst.files.files
+    for i, ext in enumerate(_FILE_TYPE_VALUES):
+        # Get the desired base file name
+        j = 0 if same_time else i
+        base_filename = os.path.splitext(inst_files.iloc[j])[0]
+        temp_file = os.path.join(data_path,
+                                 "{:s}.{:s}".format(base_filename, ext))
+
+        # Create and save the temporary file to the file list
+        os.close(os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                         0o600))  # Create an empty file
+
+        # Add file to list if it exists
+        if os.path.isfile(temp_file):
+            temp_files.append(temp_file)
+
+    return temp_files
+
+
+@pytest.fixture(scope="module")
+def netcdf_files(tmp_path_factory):
+    """Write the temporary NetCDF files once for all tests in the module.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Session-scoped factory for temporary directories removed by pytest
+
+    Returns
+    -------
+    file_sets : dict
+        Lists of temporary NetCDF file names, keyed by the number of files
+
+    Note
+    ----
+    Multi-file sets have a catalog attribute that single files lack, so the
+    single file is written separately and the multi-file sets share files.
+
+    """
+    file_sets = {1: write_netcdf_files(
+        str(tmp_path_factory.mktemp("netcdf_single")), nfiles=1)}
+
+    multi_files = write_netcdf_files(
+        str(tmp_path_factory.mktemp("netcdf_multi")), nfiles=3)
+    file_sets[2] = multi_files[:2]
+    file_sets[3] = multi_files
+
+    return file_sets
+
+
+@pytest.fixture(scope="module")
+def testing_inst():
+    """Initialize a pysat testing Instrument for all tests in the module.
+
+    Returns
+    -------
+    pysat.Instrument
+        Test Instrument, which is not modified by the tests
+
+    """
+    return pysat.Instrument('pysat', 'testing')
+
+
+@pytest.fixture(scope="module")
+def list_file_sets(tmp_path_factory, testing_inst):
+    """Write the empty temporary files once for all tests in the module.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Session-scoped factory for temporary directories removed by pytest
+    testing_inst : pysat.Instrument
+        Test Instrument shared by all tests in the module
+
+    Returns
+    -------
+    file_sets : dict
+        Tuples of the data directory and list of temporary file names,
+        keyed by the `same_time` flag used to create them
+
+    """
+    file_sets = dict()
+    for same_time in [True, False]:
+        data_path = os.path.join(str(tmp_path_factory.mktemp(
+            "list_files")), '')
+        file_sets[same_time] = (data_path, write_empty_files(
+            testing_inst, data_path, same_time=same_time))
+
+    return file_sets
+
 
 class TestLocal(object):
     """Unit tests for general methods that run locally."""
@@ -85,6 +293,7 @@ class TestLocal(object):
     @pytest.mark.skipif(version.Version(pysat.__version__)
                         < version.Version('3.0.2'),
                         reason="requires newer pysat version.")
+    @pytest.mark.slow
     @pytest.mark.parametrize("pad", [None, pds.DateOffset(days=2)])
     def test_filter_data_single_date(self, pad):
         """Test Instrument data filtering success.
@@ -229,12 +438,10 @@ class TestLocal(object):
             Logger warning message
 
         """
-        # Get the output and raise the logging warning
-        with pytest.raises(ValueError) as verr:
+        # Get the output and test the error message
+        with pytest.raises(ValueError, match=re.escape(msg)):
             general.madrigal_file_format_str(inst_code, strict=True)
 
-        # Test the logger warning
-        assert str(verr).find(msg) >= 0
         return
 
 
@@ -243,11 +450,7 @@ class TestErrors(object):
 
     def setup_method(self):
         """Create a clean testing setup."""
-        self.kwargs = {'inst_code': '10',
-                       'user': 'username',
-                       'password': 'password',
-                       'kindats': {'testing': {'tag': 1000}},
-                       'supported_tags': {'testing': {'tag': 'file%Y%m%d.nc'}}}
+        self.kwargs = copy.deepcopy(_BASE_KWARGS)
         return
 
     def teardown_method(self):
@@ -276,15 +479,15 @@ class TestErrors(object):
 
     @pytest.mark.parametrize("bad_val", [None, 17, False, 12.34])
     @pytest.mark.parametrize("test_key", ['user', 'password'])
-    def test_check_madrigal_params_bad_input(self, bad_val, test_key):
+    def test_check_madrigal_params_bad_input(self, test_key, bad_val):
         """Test that an error is thrown if non-string is passed through.
 
         Parameters
         ----------
-        bad_val
-            Any value that is not a string
         test_key : str
             Key in self.kwargs to reset
+        bad_val
+            Any value that is not a string
 
         """
         # Set up the kwargs for this test
@@ -373,29 +576,24 @@ class TestErrors(object):
 class TestSimpleFiles(object):
     """Tests for general methods with simple files."""
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        # Create testing directory
-        self.data_path = tempfile.TemporaryDirectory()
+    @pytest.fixture(autouse=True)
+    def setup_temp_file(self, tmp_path):
+        """Create a clean testing setup.
+
+        Parameters
+        ----------
+        tmp_path : pathlib.Path
+            Temporary directory provided and removed by pytest
 
-        # Initialize a test file name
-        self.temp_file = os.path.join(self.data_path.name, "temp.simple")
-        self.datalines = "\n".join(["year month day hour min sec data1",
-                                    "2009 1 1 0 0 0 -4.7"])
+        """
+        # Initialize a test file name in the testing directory
+        self.temp_file = os.path.join(str(tmp_path), "temp.simple")
+        self.datalines = _DATALINES
+        self.data_bytes = _DATALINES_BYTES
 
         # Initialize the output
         self.data = None
         self.meta = None
-
-        return
-
-    def teardown_method(self):
-        """Clean up previous testing."""
-        # Remove the temporary directory and file
-        os.remove(self.temp_file)
-        self.data_path.cleanup()
-
-        del self.data_path, self.temp_file, self.datalines, self.data, self.meta
         return
 
     def write_temp_file(self, use_gzip=True):
@@ -408,14 +606,14 @@ class TestSimpleFiles(object):
             alone if False (default=True)
 
         """
-        local_open = open
+        out_bytes = self.data_bytes
 
         if use_gzip:
-            local_open = gzip.open
             self.temp_file = ".".join([self.temp_file, 'gz'])
+            out_bytes = gzip_bytes(out_bytes)
 
-        with local_open(self.temp_file, 'w') as fout:
-            fout.write(bytes(self.datalines, 'utf-8'))
+        with open(self.temp_file, 'wb') as fout:
+            fout.write(out_bytes)
 
         return
 
@@ -440,15 +638,14 @@ class TestSimpleFiles(object):
     def test_load_bad_times(self):
         """Test load raises ValueError with bad time data."""
         # Update the data lines, removing some time inputs
-        self.datalines = "\n".join(["year month day hour min data1",
-                                    "2009 1 1 0 0 -4.7"])
+        self.datalines = _BAD_TIME_DATALINES
+        self.data_bytes = _BAD_TIME_DATALINES_BYTES
         self.write_temp_file()
 
-        # Retrieve error message
-        with pytest.raises(ValueError) as verr:
+        # Test the error message
+        with pytest.raises(ValueError, match="unable to construct time index"):
             general.load([self.temp_file])
 
-        assert str(verr).find("unable to construct time index") >= 0
         return
 
     def test_load_bad_coords(self):
@@ -456,11 +653,10 @@ class TestSimpleFiles(object):
         # Write a temporary file
         self.write_temp_file()
 
-        # Retrieve error message
-        with pytest.raises(ValueError) as verr:
+        # Test the error message
+        with pytest.raises(ValueError, match="unknown coordinate key"):
             general.load([self.temp_file], xarray_coords=['lat'])
 
-        assert str(verr).find("unknown coordinate key") >= 0
         return
 
     @pytest.mark.parametrize('xarray_coords', [None, ['time']])
@@ -488,6 +684,7 @@ class TestSimpleFiles(object):
         # Add a duplicate line
         self.datalines = '\n'.join([self.datalines,
                                     self.datalines.split('\n')[-1]])
+        self.data_bytes = self.datalines.encode('utf-8')
 
         # Write a temporary file
         self.write_temp_file()
@@ -510,10 +707,7 @@ class TestNetCDFFiles(object):
 
     def setup_method(self):
         """Create a clean testing setup."""
-        # Create testing directory
-        self.data_path = tempfile.TemporaryDirectory()
-
-        # Initialize a test file name
+        # Initialize the test file names and coordinates
         self.temp_files = []
         self.xarray_coords = [{('time',): ['time'],
                                ('lat',): ['lat'],
@@ -528,71 +722,7 @@ class TestNetCDFFiles(object):
 
     def teardown_method(self):
         """Clean up previous testing."""
-        # Remove the temporary directory and file
-        for tfile in self.temp_files:
-            if os.path.isfile(tfile):
-                try:
-                    os.remove(tfile)
-                except PermissionError:
-                    pass  # Windows thinks files are always open
-
-        try:
-            self.data_path.cleanup()
-        except Exception:
-            # TODO(#https://github.com/pysat/pysat/issues/974): Windows fix
-            # until `ignore_cleanup_errors=True` can be used (3.10 is lowest)
-            pass
-
-        del self.data_path, self.temp_files, self.xarray_coords, self.data
-        del self.meta
-        return
-
-    def write_temp_files(self, nfiles=0):
-        """Write data to a temporary file, zipping if desired.
-
-        Parameters
-        ----------
-        nfiles : int
-            Number of temporary NetCDF files to write (default=0)
-
-        """
-        for i in range(nfiles):
-            tfile = os.path.join(self.data_path.name,
-                                 "temp{:d}.netCDF4".format(i))
-
-            # Write a temporary file with data, based off of example:
-            # https://opensourceoptions.com/blog/
-            #    create-netcdf-files-with-python/
-            with nc.Dataset(tfile, "w", format="NETCDF4") as ds:
-                # Write the file attributes
-                if nfiles > 1:
-                    ds.catalog_text = "catalog text test"
-
-                # Write the file dimensions, using Madrigal defaults
-                ds.createDimension('timestamps', None)
-                ds.createDimension('lat', 10)
-                ds.createDimension('lon', 10)
-
-                # Write the data
-                dat_dict = {dkey: ds.createVariable(dkey, 'f4', (dkey,))
-                            for dkey in ['timestamps', 'lat', 'lon']}
-
-                dat_dict['value'] = ds.createVariable(
-                    'value', 'f4', ('timestamps', 'lat', 'lon',))
-
-                dat_dict['timestamps'][0] = i
-                dat_dict['lat'][:] = np.arange(40.0, 50.0, 1.0)
-                dat_dict['lon'][:] = np.arange(-110.0, -100.0, 1.0)
-                dat_dict['value'][0, :, :] = np.random.uniform(0, 100,
-                                                               size=(10, 10))
-
-                # Write the default Madrigal meta data
-                for dat_name in ['lat', 'lon', 'value']:
-                    dat_dict[dat_name].units = 'deg'
-                    dat_dict[dat_name].description = 'test data set'
-
-            self.temp_files.append(tfile)
-
+        del self.temp_files, self.xarray_coords, self.data, self.meta
         return
 
     def eval_dataset_meta_output(self):
@@ -621,17 +751,19 @@ class TestNetCDFFiles(object):
         return
 
     @pytest.mark.parametrize("nfiles", [1, 2, 3])
-    def test_load_netcdf(self, nfiles):
+    def test_load_netcdf(self, nfiles, netcdf_files):
         """Test the loading of single or multiple NetCDF files.
 
         Parameters
         ----------
         nfiles : int
             Number of NetCDF files to load
+        netcdf_files : dict
+            Lists of temporary NetCDF file names, keyed by the number of files
 
         """
-        # Create the temporary files
-        self.write_temp_files(nfiles=nfiles)
+        # Get the temporary files
+        self.temp_files = netcdf_files[nfiles]
 
         # Load the file data
         self.data, self.meta = general.load(self.temp_files, self.xarray_coords)
@@ -644,10 +776,17 @@ class TestNetCDFFiles(object):
 
         return
 
-    def test_load_netcdf_extra_xarray_coord(self):
-        """Test the loading of a NetCDF file with extra xarray coordinates."""
-        # Create the temporary files
-        self.write_temp_files(nfiles=1)
+    def test_load_netcdf_extra_xarray_coord(self, netcdf_files):
+        """Test the loading of a NetCDF file with extra xarray coordinates.
+
+        Parameters
+        ----------
+        netcdf_files : dict
+            Lists of temporary NetCDF file names, keyed by the number of files
+
+        """
+        # Get the temporary file
+        self.temp_files = netcdf_files[1]
 
         # Add extra xarray coordinates
         self.xarray_coords[0][('space',)] = ['space']
@@ -667,66 +806,33 @@ class TestNetCDFFiles(object):
 class TestListFiles(object):
     """Tests for general methods function `list_files`."""
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        # Initalize a pysat Instrument
-        self.inst = pysat.Instrument('pysat', 'testing')
-
-        # Initialize a test file name and supported tags
-        self.temp_files = []
-        self.supported_tags = {self.inst.inst_id: {
-            self.inst.tag: '{{year:4d}}-{{month:02d}}-{{day:02d}}.{file_type}'}}
-
-        # Create the Instrument data path.
-        pysat.utils.files.check_and_make_path(self.inst.files.data_path)
-
-        return
-
-    def teardown_method(self):
-        """Clean up previous testing."""
-        # Remove the temporary file, if it exists
-        for tfile in self.temp_files:
-            if os.path.isfile(tfile):
-                os.remove(tfile)
-
-        del self.inst, self.temp_files, self.supported_tags
-        return
-
-    def write_temp_files(self, same_time=False):
-        """Create empty temporary files.
+    @pytest.fixture(autouse=True)
+    def setup_inst(self, testing_inst):
+        """Create a clean testing setup.
 
         Parameters
         ----------
-        same_time : bool
-            Use the same base filename for the temporary files with different
-            extension if True, use different base filenames if False.
-            (default=False)
+        testing_inst : pysat.Instrument
+            Test Instrument shared by all tests in the module
 
-        Return
-        ------
-        bool
-            True if the correct number of files were created, False if not
+        Note
+        ----
+        Files are written to temporary directories instead of the Instrument
+        data directory, allowing tests to be run in parallel. Each test sets
+        the directory it lists.
 
         """
-        for i, ext in enumerate(general.file_types.values()):
-            # Get the desired base file name
-            j = 0 if same_time else i
-            base_filename = os.path.splitext(self.inst.files.files[j])[0]
-            temp_file = os.path.join(self.inst.files.data_path,
-                                     "{:s}.{:s}".format(base_filename, ext))
-
-            # Create and save the temporary file to the file list
-            with open(temp_file, 'w'):
-                pass  # Create an empty file
-
-            # Add file to list if it exists
-            if os.path.isfile(temp_file):
-                self.temp_files.append(temp_file)
+        # Assign the shared pysat Instrument
+        self.inst = testing_inst
 
-        return len(self.temp_files) == len(general.file_types.values())
+        # Initialize the test directory, file names, and supported tags
+        self.data_path = None
+        self.temp_files = []
+        self.supported_tags = _LIST_SUPPORTED_TAGS
+        return
 
     @pytest.mark.parametrize("same_time", [True, False])
-    def test_list_files_mult_type(self, same_time):
+    def test_list_files_mult_type(self, same_time, list_file_sets):
         """Test `list_files` with multiple file types.
 
         Parameters
@@ -734,18 +840,21 @@ class TestListFiles(object):
         same_time : bool
             Use the same base filename for the temporary files with different
             extension if True, use different base filenames if False.
+        list_file_sets : dict
+            Data directories and temporary files, keyed by `same_time`
 
         """
-        #  Write the temporary files
-        assert self.write_temp_files(same_time=same_time)
+        #  Get the temporary files
+        self.data_path, self.temp_files = list_file_sets[same_time]
+        assert len(self.temp_files) == len(_FILE_TYPE_VALUES)
 
         # List the temporary files
         out_files = general.list_files(self.inst.tag, self.inst.inst_id,
-                                       data_path=self.inst.files.data_path,
+                                       data_path=self.data_path,
                                        supported_tags=self.supported_tags)
 
         # Prepare the testing data
-        out_list = [os.path.join(self.inst.files.data_path, ofile)
+        out_list = [os.path.join(self.data_path, ofile)
                     for ofile in out_files]
         ntimes = 1 if same_time else len(self.temp_files)
 
@@ -754,32 +863,41 @@ class TestListFiles(object):
         assert len(out_files.index.unique()) == ntimes
         return
 
-    @pytest.mark.parametrize("same_time", [True, False])
-    @pytest.mark.parametrize("file_type", [
-        ftype for ftype in general.file_types.keys()])
-    def test_list_files_single_type(self, same_time, file_type):
+    @pytest.mark.parametrize("file_type, same_time", [
+        (ftype, i % 2 == 0) for i, ftype in enumerate(_FILE_TYPE_KEYS)],
+        ids=_FILE_TYPE_KEYS)
+    def test_list_files_single_type(self, file_type, same_time,
+                                    list_file_sets):
         """Test `list_files` with multiple file types.
 
         Parameters
         ----------
+        file_type : str
+            File type to list.
         same_time : bool
             Use the same base filename for the temporary files with different
             extension if True, use different base filenames if False.
-        file_type : str
-            File type to list.
+        list_file_sets : dict
+            Data directories and temporary files, keyed by `same_time`
+
+        Note
+        ----
+        Each file type is tested once, alternating `same_time`, as the two
+        inputs do not interact.
 
         """
-        #  Write the temporary files
-        assert self.write_temp_files(same_time=same_time)
+        #  Get the temporary files
+        self.data_path, self.temp_files = list_file_sets[same_time]
+        assert len(self.temp_files) == len(_FILE_TYPE_VALUES)
 
         # List the temporary files
         out_files = general.list_files(self.inst.tag, self.inst.inst_id,
-                                       data_path=self.inst.files.data_path,
+                                       data_path=self.data_path,
                                        supported_tags=self.supported_tags,
                                        file_type=file_type)
 
         # Prepare the testing data
-        out_list = [os.path.join(self.inst.files.data_path, ofile)
+        out_list = [os.path.join(self.data_path, ofile)
                     for ofile in out_files]
 
         # Test the listed file names and time indexes
@@ -787,8 +905,8 @@ class TestListFiles(object):
         assert len(out_files.index) == 1
         return
 
-    @pytest.mark.parametrize("file_type", [None, 'hdf5', 'simple', 'netCDF4'])
-    def test_list_no_files(self, file_type):
+    @pytest.mark.parametrize("file_type", (None,) + _FILE_TYPE_KEYS)
+    def test_list_no_files(self, file_type, tmp_path):
         """Test listing files without creating temporary files.
 
         Parameters
@@ -796,11 +914,17 @@ class TestListFiles(object):
         file_type : str or NoneType
             File format for Madrigal data. If None, will look for all known
             file types.
+        tmp_path : pathlib.Path
+            Empty temporary directory provided and removed by pytest
 
         """
+        # Use an empty test directory. As with Instrument data paths, the
+        # directory must end in a path separator.
+        self.data_path = os.path.join(str(tmp_path), '')
+
         # List the temporary files with
         out_files = general.list_files(self.inst.tag, self.inst.inst_id,
-                                       data_path=self.inst.files.data_path,
+                                       data_path=self.data_path,
                                        supported_tags=self.supported_tags,
                                        file_type=file_type)
 
@@ -17,6 +17,9 @@ from pysat.utils.testing import eval_bad_input
 
 from pysatMadrigal.instruments.methods import gnss
 
+# File names with file types that cannot be loaded as LoS data
+_BAD_FNAMES = ('los_20230101.simple.gz', 'los_20230102.netCDF4')
+
 
 class TestGNSSRefs(object):
     """Test the acknowledgements and references for the GNSS instruments."""
@@ -44,22 +47,12 @@ class TestGNSSRefs(object):
 class TestGNSSBadLoad(object):
     """Test GNSS load warnings and errors."""
 
-    def setup_method(self):
-        """Run before every method to create a clean testing setup."""
-        self.bad_fnames = ['los_20230101.simple.gz', 'los_20230102.netCDF4']
-        return
-
-    def teardown_method(self):
-        """Run after every method to clean up previous testing."""
-        del self.bad_fnames
-        return
-
     def test_bad_file_type_warning(self, caplog):
         """Test logger warning for unsupported file types loading LoS data."""
 
         # Get the output and raise the logging warning
         with caplog.at_level(logging.WARN, logger='pysat'):
-            gnss.load_los(self.bad_fnames, "site", "zzon")
+            gnss.load_los(list(_BAD_FNAMES), "site", "zzon")
 
         # Test the logger warning
         # TODO(#101) Use pysat eval warnings
@@ -74,12 +67,12 @@ class TestGNSSBadLoad(object):
         """Test ValueError raised for an unknown LoS down-selection type."""
 
         eval_bad_input(gnss.load_los, ValueError, "unsupported selection type",
-                       input_args=[self.bad_fnames, "bad_sel", "bad_val"])
+                       input_args=[list(_BAD_FNAMES), "bad_sel", "bad_val"])
         return
 
     def test_empty_los_load(self):
         """Test the returned dataset is empty for a LoS load."""
-        data, meta, lats, lons = gnss.load_los(self.bad_fnames, "time",
+        data, meta, lats, lons = gnss.load_los(list(_BAD_FNAMES), "time",
                                                dt.datetime(2023, 1, 1))
 
         assert len(data.dims.keys()) == 0
@@ -17,6 +17,25 @@ import pysat
 
 from pysatMadrigal.instruments.methods import jro
 
+# Load date and number of times for the test Instrument
+_STIME = pysat.instruments.pysat_ndtesting._test_dates['']['']
+_NUM_SAMPLES = 100
+
+
+@pytest.fixture(scope="module")
+def loaded_inst():
+    """Load the `ndtesting` Instrument once for all tests in the module.
+
+    Returns
+    -------
+    inst : pysat.Instrument
+        Test Instrument with loaded data, which should be copied before use
+
+    """
+    inst = pysat.Instrument('pysat', 'ndtesting', num_samples=_NUM_SAMPLES)
+    inst.load(date=_STIME)
+    return inst
+
 
 class TestJRORefs(object):
     """Test the acknowledgements and references for the JRO instruments."""
@@ -26,11 +45,6 @@ class TestJRORefs(object):
         self.out = None
         return
 
-    def teardown_method(self):
-        """Run after every method to clean up previous testing."""
-        del self.out
-        return
-
     @pytest.mark.parametrize("func, comp_str", [
         ('acknowledgements', 'Jicamarca Radio Observatory'),
         ('references', 'contact PI')])
@@ -44,10 +58,22 @@ class TestJRORefs(object):
 class TestJROCalcLoc(object):
     """Test the JRO support function `calc_measurement_loc`."""
 
-    def setup_method(self):
-        """Run before every method to create a clean testing setup."""
-        self.inst = pysat.Instrument('pysat', 'ndtesting', num_samples=100)
-        self.stime = pysat.instruments.pysat_ndtesting._test_dates['']['']
+    # Altitude coordinate and range data used to mirror the JRO-ISR data
+    _GDALT = np.arange(100.0, 1000.0, 15.0)
+    _GDALT_RANGE_2D = np.broadcast_to(_GDALT, (_NUM_SAMPLES, _GDALT.size))
+
+    @pytest.fixture(autouse=True)
+    def setup_inst(self, loaded_inst):
+        """Create a clean testing setup.
+
+        Parameters
+        ----------
+        loaded_inst : pysat.Instrument
+            Test Instrument with loaded data, shared by all tests in the module
+
+        """
+        # Copy the loaded Instrument, as the tests alter the data and metadata
+        self.inst = loaded_inst.copy()
 
         # Set the hard-coded values
         self.az = 206.0
@@ -59,60 +85,42 @@ class TestJROCalcLoc(object):
         self.tol = 1.0e-4
         return
 
-    def teardown_method(self):
-        """Run after every method to clean up previous testing."""
-        del self.inst, self.stime, self.az, self.el
-        del self.lat_min, self.lat_max, self.lon_min, self.lon_max, self.tol
-        return
-
     def transform_testing_to_jro(self, azel_type=''):
         """Alter `ndtesting` to mirror the JRO-ISR data."""
-        # Load the data
-        self.inst.load(date=self.stime)
-
         # Alter the coordinates
         self.inst.data = self.inst.data.assign_coords(
-            {'gdalt': np.arange(100.0, 1000.0, 15.0), 'gdlatr': -11.95,
-             'gdlonr': -76.87})
+            {'gdalt': self._GDALT, 'gdlatr': -11.95, 'gdlonr': -76.87})
 
-        # Alter the data, if requested
+        # Set the constant data as read-only, zero-copy views. The 2D range
+        # data is shared by all tests through `_GDALT_RANGE_2D`.
+        az_data = np.broadcast_to(np.float64(self.az), self.inst.index.shape)
+        el_data = np.broadcast_to(np.float64(self.el), self.inst.index.shape)
+
+        # Collect the requested data, to alter the Dataset only once
+        new_vars = dict()
         if azel_type in ['m', 'both', 'both_norange']:
-            self.inst.data = self.inst.data.assign(
-                {'azm': (("time"), np.full(shape=self.inst.index.shape,
-                                           fill_value=self.az)),
-                 'elm': (("time"), np.full(shape=self.inst.index.shape,
-                                           fill_value=self.el)),
-                 'rgate': (("time"), np.full(shape=self.inst.index.shape,
-                                             fill_value=15.0))})
+            new_vars.update(
+                {'azm': (("time"), az_data), 'elm': (("time"), el_data),
+                 'rgate': (("time"), np.broadcast_to(np.float64(15.0),
+                                                     self.inst.index.shape))})
 
         if azel_type in ['dir', 'both']:
-            self.inst.data = self.inst.data.assign(
-                {'azdir7': (("time"), np.full(shape=self.inst.index.shape,
-                                              fill_value=self.az)),
-                 'eldir7': (("time"), np.full(shape=self.inst.index.shape,
-                                              fill_value=self.el)),
-                 'range': (("time", "gdalt"),
-                           np.full(shape=(self.inst.index.shape[0],
-                                          self.inst['gdalt'].shape[0]),
-                                   fill_value=self.inst['gdalt']))})
+            new_vars.update(
+                {'azdir7': (("time"), az_data), 'eldir7': (("time"), el_data),
+                 'range': (("time", "gdalt"), self._GDALT_RANGE_2D)})
 
         if azel_type in ['dir_norange', 'both_norange']:
-            self.inst.data = self.inst.data.assign(
-                {'azdir7': (("time"), np.full(shape=self.inst.index.shape,
-                                              fill_value=self.az)),
-                 'eldir7': (("time"), np.full(shape=self.inst.index.shape,
-                                              fill_value=self.el))})
+            new_vars.update(
+                {'azdir7': (("time"), az_data), 'eldir7': (("time"), el_data)})
 
         if azel_type == 'baddir':
-            self.inst.data = self.inst.data.assign(
-                {'azdirX': (("time"), np.full(shape=self.inst.index.shape,
-                                              fill_value=self.az)),
-                 'eldirX': (("time"), np.full(shape=self.inst.index.shape,
-                                              fill_value=self.el)),
-                 'range': (("time", "gdalt"),
-                           np.full(shape=(self.inst.index.shape[0],
-                                          self.inst['gdalt'].shape[0]),
-                                   fill_value=self.inst['gdalt']))})
+            new_vars.update(
+                {'azdirX': (("time"), az_data), 'eldirX': (("time"), el_data),
+                 'range': (("time", "gdalt"), self._GDALT_RANGE_2D)})
+
+        # Alter the data, if requested
+        if len(new_vars) > 0:
+            self.inst.data = self.inst.data.assign(new_vars)
 
         return
 
@@ -151,12 +159,10 @@ class TestJROCalcLoc(object):
         # Format the test Instrument
         self.transform_testing_to_jro(azel_type=azel_type)
 
-        # Capture the expected error message
-        with pytest.raises(ValueError) as verr:
+        # Test the expected error message
+        with pytest.raises(ValueError, match=err_msg):
             jro.calc_measurement_loc(self.inst)
 
-        # Test the error message
-        assert str(verr).find(err_msg) >= 0
         return
 
     def test_bad_dirnumber(self, caplog):
@@ -164,17 +170,14 @@ class TestJROCalcLoc(object):
         # Format the test Instrument
         self.transform_testing_to_jro(azel_type='baddir')
 
-        # Capture the expected log message
-        with pytest.raises(ValueError) as verr:
+        # Capture the expected log message and test the ValueError message
+        with pytest.raises(ValueError, match="No matching azimuth"):
             with caplog.at_level(logging.WARN, logger='pysat'):
                 jro.calc_measurement_loc(self.inst)
 
         # Test the log output
         captured = caplog.text
         assert captured.find('Unknown direction number') >= 0
-
-        # Test the ValueError message
-        assert str(verr).find("No matching azimuth") >= 0
         return
 
     @pytest.mark.parametrize("azel_type, new_vals", [
@@ -195,8 +198,8 @@ class TestJROCalcLoc(object):
         # Test the calculated outputs
         for val in new_vals:
             # Test the dimensions
-            pysat.utils.testing.assert_lists_equal(
-                ['gdalt', 'time'], list(self.inst[val].dims))
+            assert set(self.inst[val].dims) == {'gdalt', 'time'}, \
+                "unexpected dimensions: {:}".format(self.inst[val].dims)
 
             # Test the value ranges
             if val.find("lat") > 0:
@@ -9,92 +9,224 @@
 # ----------------------------------------------------------------------------
 """Tests for the coordinate conversion functions."""
 import numpy as np
-
 import pytest
+import types
 
 from pysatMadrigal.utils import coords
 
-
-class TestGeodeticGeocentric(object):
-    """Unit tests for geodetic to geocentric conversion methods."""
+# Expected conversion outputs for the class test inputs
+_GEO_FWD = np.array([44.8075768, 8.0, 6367.48954386])
+_GEO_INV = np.array([45.1924232, 8.0, 6367.3459085])
+_GEO_HORIZ_FWD = np.array([44.8075768, 8.0, 6367.48954386, 51.7037677,
+                           62.8811403])
+_GEO_HORIZ_INV = np.array([45.1924232, 8.0, 6367.3459085, 52.2989610,
+                           63.1180720])
+_GLOBAL_LOCAL_FWD = np.array([9223.1752649, 10357.58863188, -5094.15562118])
+_GLOBAL_LOCAL_INV = np.array([9005.5925135, -4653.2653305, 15709.5775005])
+_LOCAL_GEODETIC = np.array([49.62613564, 4.153673708, 7500.81015865])
+_LOCAL_GEOCENTRIC = np.array([49.60665778, 4.1652362, 7511.4633082])
+
+# Number of values in the array test inputs, with None for scalar inputs
+_NVALS = [None, 1, 10, 10000]
+
+
+def broadcast_vals(val_dict, nvals=10):
+    """Broadcast scalar test values to read-only arrays.
+
+    Parameters
+    ----------
+    val_dict : dict
+        Dict of scalar test values
+    nvals : int
+        Number of values in each output array (default=10)
+
+    Returns
+    -------
+    dict
+        Dict with the same keys, holding zero-copy array views of the values
+
+    Note
+    ----
+    The coordinate functions do not alter their inputs, so the views are
+    never written to.
+
+    """
+    return {key: np.broadcast_to(np.float64(val), (nvals,))
+            for key, val in val_dict.items()}
+
+
+def eval_stacked_output(out, target, in_shape):
+    """Evaluate all conversion outputs against their targets at once.
+
+    Parameters
+    ----------
+    out : array-like
+        Conversion outputs, with the output values along the leading axes
+    target : array-like
+        Expected output values, with the same leading axes as `out`
+    in_shape : tuple
+        Shape of the conversion inputs, expected for each output value
+
+    """
+    out = np.asarray(out)
+    nlead = out.ndim - len(in_shape)
+    assert out.shape[nlead:] == in_shape, \
+        "mismatched output shape: {:} != {:}".format(out.shape[nlead:],
+                                                     in_shape)
+
+    # Add trailing axes to the targets so they broadcast against the outputs
+    target = np.asarray(target)
+    target = np.reshape(target, target.shape + (1,) * (out.ndim - target.ndim))
+    np.testing.assert_allclose(out, np.broadcast_to(target, out.shape),
+                               rtol=0, atol=1.0e-6)
+    return
+
+
+class CoordTests(object):
+    """Shared setup for the coordinate conversion test classes.
+
+    Note
+    ----
+    Subclasses must define the scalar test inputs as the class attribute
+    `val`.
+
+    """
 
     def setup_method(self):
         """Create a clean testing setup."""
-        self.val = {'lat': 45.0, 'lon': 8.0, 'az': 52.0, 'el': 63.0}
         self.out = None
         self.loc = None
         return
 
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
+    def set_array_vals(self, nvals):
+        """Set the test values as arrays, if desired.
+
+        Parameters
+        ----------
+        nvals : int or NoneType
+            Number of values in each input array, or None to use scalar inputs
+
+        """
+        if nvals is not None:
+            self.val = broadcast_vals(self.val, nvals=nvals)
         return
 
-    @pytest.mark.parametrize("kwargs,target",
-                             [({}, [44.8075768, 8.0, 6367.48954386]),
-                              ({'inverse': False},
-                               [44.8075768, 8.0, 6367.48954386]),
-                              ({'inverse': True},
-                               [45.1924232, 8.0, 6367.3459085])])
-    def test_geodetic_to_geocentric(self, kwargs, target):
-        """Test conversion from geodetic to geocentric coordinates."""
-        self.out = coords.geodetic_to_geocentric(self.val['lat'],
-                                                 lon_in=self.val['lon'],
-                                                 **kwargs)
-
-        for i, self.loc in enumerate(self.out):
-            assert np.all(abs(self.loc - target[i]) < 1.0e-6)
-            if isinstance(self.loc, np.ndarray):
-                assert self.loc.shape == self.val['lat'].shape, \
-                    "mismatched output shape: {:} != {:}".format(
-                        self.loc.shape, self.val['lat'].shape)
+
+class TestGeodeticGeocentric(CoordTests):
+    """Unit tests for geodetic to geocentric conversion methods."""
+
+    # Test inputs, shared by all tests and read-only to keep them unaltered
+    val = types.MappingProxyType({'lat': 45.0, 'lon': 8.0, 'az': 52.0,
+                                  'el': 63.0})
+
+    @pytest.mark.parametrize("nvals", _NVALS)
+    def test_geodetic_to_geocentric(self, nvals):
+        """Test geodetic to geocentric conversions in both directions."""
+        self.set_array_vals(nvals)
+
+        # Convert the same inputs in both directions, using the default for
+        # the forward conversion
+        self.out = [coords.geodetic_to_geocentric(self.val['lat'],
+                                                  lon_in=self.val['lon']),
+                    coords.geodetic_to_geocentric(self.val['lat'],
+                                                  lon_in=self.val['lon'],
+                                                  inverse=True)]
+
+        # Compare all outputs at once, with the directions along the first
+        # axis and the outputs along the second axis
+        eval_stacked_output(self.out, [_GEO_FWD, _GEO_INV],
+                            np.shape(self.val['lat']))
         return
 
-    def test_geodetic_to_geocentric_and_back(self):
-        """Test the reversibility of geodetic to geocentric conversions."""
+    @pytest.mark.parametrize("nvals", _NVALS)
+    def test_geodetic_to_geocentric_and_back(self, nvals):
+        """Test the reversibility of geodetic to geocentric conversions.
+
+        Note
+        ----
+        Also tests the output of the forward conversion with `inverse=False`
+
+        """
+        self.set_array_vals(nvals)
         self.out = coords.geodetic_to_geocentric(self.val['lat'],
                                                  lon_in=self.val['lon'],
                                                  inverse=False)
+        eval_stacked_output(self.out, _GEO_FWD, np.shape(self.val['lat']))
+
         self.loc = coords.geodetic_to_geocentric(self.out[0],
                                                  lon_in=self.out[1],
                                                  inverse=True)
-        assert np.all(abs(self.val['lat'] - self.loc[0]) < 1.0e-6), "bad lat"
-        assert np.all(abs(self.val['lon'] - self.loc[1]) < 1.0e-6), "bad lon"
+        eval_stacked_output(self.loc[:2], [self.val['lat'], self.val['lon']],
+                            np.shape(self.val['lat']))
         return
 
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_geodetic_to_geocentric_and_back_random(self, seed):
+        """Test geodetic to geocentric reversibility for random locations.
+
+        Parameters
+        ----------
+        seed : int
+            Seed for the random number generator, keeping the test repeatable
+
+        """
+        rng = np.random.default_rng(seed)
+        self.val = {'lat': rng.uniform(-89.0, 89.0, 1000),
+                    'lon': rng.uniform(-180.0, 360.0, 1000)}
+        self.out = coords.geodetic_to_geocentric(self.val['lat'],
+                                                 lon_in=self.val['lon'])
+        self.loc = coords.geodetic_to_geocentric(self.out[0],
+                                                 lon_in=self.out[1],
+                                                 inverse=True)
+
+        eval_stacked_output(self.loc[:2], [self.val['lat'], self.val['lon']],
+                            np.shape(self.val['lat']))
+
+        # The geocentric radius must lie between the polar and equatorial radii
+        assert np.all((self.out[2] > 6356.75) & (self.out[2] < 6378.14)), \
+            "Earth radius outside of the WGS-84 limits"
+        return
+
+    @pytest.mark.parametrize("nvals", _NVALS)
     @pytest.mark.parametrize("kwargs,target",
-                             [({}, [44.8075768, 8.0, 6367.48954386,
-                                    51.7037677, 62.8811403]),
-                              ({'inverse': False},
-                               [44.8075768, 8.0, 6367.48954386,
-                                51.7037677, 62.8811403]),
-                              ({'inverse': True},
-                               [45.1924232, 8.0, 6367.3459085,
-                                52.2989610, 63.1180720])])
-    def test_geodetic_to_geocentric_horizontal(self, kwargs, target):
+                             [({}, _GEO_HORIZ_FWD),
+                              ({'inverse': True}, _GEO_HORIZ_INV)],
+                             ids=["default", "inverse"])
+    def test_geodetic_to_geocentric_horizontal(self, kwargs, target, nvals):
         """Test conversion from geodetic to geocentric coordinates."""
+        self.set_array_vals(nvals)
         self.out = coords.geodetic_to_geocentric_horizontal(self.val['lat'],
                                                             self.val['lon'],
                                                             self.val['az'],
                                                             self.val['el'],
                                                             **kwargs)
 
-        for i, self.loc in enumerate(self.out):
-            assert np.all(abs(self.loc - target[i]) < 1.0e-6)
-            if isinstance(self.loc, np.ndarray):
-                assert self.loc.shape == self.val['lat'].shape, \
-                    "mismatched output shape: {:} != {:}".format(
-                        self.loc.shape, self.val['lat'].shape)
+        eval_stacked_output(self.out, target, np.shape(self.val['lat']))
         return
 
-    def test_geodetic_to_geocentric_horizontal_and_back(self):
+    @pytest.mark.parametrize("nvals", _NVALS)
+    def test_geodetic_to_geocentric_horizontal_and_back(self, nvals):
         """Test the reversibility of geodetic to geocentric horiz conversions.
 
+        Parameters
+        ----------
+        nvals : int or NoneType
+            Number of random values in each input array, or None to use the
+            scalar class inputs
+
         Note
         ----
-        Inverse of az and el angles currently non-functional
+        Array inputs are seeded random locations and angles, converted with a
+        single call in each direction.  Azimuths are compared modulo 360 deg.
 
         """
+        if nvals is not None:
+            rng = np.random.default_rng(0)
+            self.val = {'lat': rng.uniform(-80.0, 80.0, nvals),
+                        'lon': rng.uniform(-180.0, 180.0, nvals),
+                        'az': rng.uniform(0.0, 360.0, nvals),
+                        'el': rng.uniform(0.0, 90.0, nvals)}
+
         self.out = coords.geodetic_to_geocentric_horizontal(self.val['lat'],
                                                             self.val['lon'],
                                                             self.val['az'],
@@ -106,131 +238,159 @@ class TestGeodeticGeocentric(object):
                                                             self.out[4],
                                                             inverse=True)
 
-        assert np.all(abs(self.val['lat'] - self.loc[0]) < 1.0e-6), "bad lat"
-        assert np.all(abs(self.val['lon'] - self.loc[1]) < 1.0e-6), "bad lon"
-        assert np.all(abs(self.val['az'] - self.loc[3]) < 1.0e-6), "bad az"
-        assert np.all(abs(self.val['el'] - self.loc[4]) < 1.0e-6), "bad el"
+        eval_stacked_output([self.loc[0], self.loc[1], self.loc[4]],
+                            [self.val['lat'], self.val['lon'], self.val['el']],
+                            np.shape(self.val['lat']))
+
+        np.testing.assert_allclose(
+            np.mod(self.loc[3] - self.val['az'] + 180.0, 360.0) - 180.0, 0.0,
+            rtol=0, atol=1.0e-6, err_msg="bad az")
         return
 
+    @pytest.mark.parametrize("inverse", [False, True])
+    def test_geodetic_to_geocentric_horizontal_vector(self, inverse):
+        """Test the horizontal angles against the pointing vector geometry.
 
-class TestGeodeticGeocentricArray(TestGeodeticGeocentric):
-    """Unit tests for geodetic to geocentric array conversion."""
+        Parameters
+        ----------
+        inverse : bool
+            False for geodetic to geocentric, True for inverse
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        arr = np.ones(shape=(10,), dtype=float)
-        self.val = {'lat': 45.0 * arr,
-                    'lon': 8.0 * arr,
-                    'az': 52.0 * arr,
-                    'el': 63.0 * arr}
-        self.out = None
-        self.loc = None
-        return
+        Note
+        ----
+        Builds the pointing vector in Earth-centred cartesian coordinates from
+        the local axes at the input latitude, and projects it onto the local
+        axes at the output latitude.  The longitude does not alter the angles,
+        so it is set to zero.
 
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
+        """
+        rng = np.random.default_rng(0)
+        nvals = 1024
+        self.val = {'lat': rng.uniform(-89.0, 89.0, nvals),
+                    'az': rng.uniform(0.0, 360.0, nvals),
+                    'el': rng.uniform(-89.0, 89.0, nvals)}
+        self.out = coords.geodetic_to_geocentric_horizontal(self.val['lat'],
+                                                            0.0,
+                                                            self.val['az'],
+                                                            self.val['el'],
+                                                            inverse=inverse)
+
+        # Get the local East, North, and vertical unit vectors at both
+        # latitudes, with East along the cartesian y-axis at zero longitude
+        east = np.array([0.0, 1.0, 0.0])[:, np.newaxis]
+        lat_in = np.radians(self.val['lat'])
+        lat_out = np.radians(self.out[0])
+        north_in = np.array([-np.sin(lat_in), 0.0 * lat_in, np.cos(lat_in)])
+        up_in = np.array([np.cos(lat_in), 0.0 * lat_in, np.sin(lat_in)])
+        north_out = np.array([-np.sin(lat_out), 0.0 * lat_out,
+                              np.cos(lat_out)])
+        up_out = np.array([np.cos(lat_out), 0.0 * lat_out, np.sin(lat_out)])
+
+        # Build the pointing vector from the input angles
+        az = np.radians(self.val['az'])
+        el = np.radians(self.val['el'])
+        pnt = (np.cos(el) * np.sin(az) * east
+               + np.cos(el) * np.cos(az) * north_in + np.sin(el) * up_in)
+
+        # Project the pointing vector onto the output axes
+        el_target = np.degrees(np.arcsin(np.sum(pnt * up_out, axis=0)))
+        az_target = np.degrees(np.arctan2(np.sum(pnt * east, axis=0),
+                                          np.sum(pnt * north_out, axis=0)))
+
+        np.testing.assert_allclose(self.out[4], el_target, rtol=0,
+                                   atol=1.0e-9, err_msg="bad el")
+        np.testing.assert_allclose(
+            np.mod(self.out[3] - az_target + 180.0, 360.0) - 180.0, 0.0,
+            rtol=0, atol=1.0e-9, err_msg="bad az")
         return
 
+    @pytest.mark.parametrize("inverse", [False, True])
+    def test_geodetic_to_geocentric_horizontal_near_zenith(self, inverse):
+        """Test the horizontal elevation precision for near-vertical pointing.
 
-class TestSphereCartesian(object):
-    """Unit tests for spherical/cartesian conversions."""
+        Parameters
+        ----------
+        inverse : bool
+            False for geodetic to geocentric, True for inverse
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        self.val = {'az': 45.0, 'el': 30.0, 'r': 1.0,
-                    'x': 0.6123724356957946,
-                    'y': 0.6123724356957946,
-                    'z': 0.5}
-        self.out = None
-        self.loc = None
-        return
+        Note
+        ----
+        At the equator the local vertical is unchanged, so the elevation must
+        be returned as input.  This is where an arcsine of the vertical
+        component would be least precise.
 
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
+        """
+        self.val = {'az': np.linspace(0.0, 360.0, 1001),
+                    'el': np.linspace(89.99, 90.0, 1001)}
+        self.out = coords.geodetic_to_geocentric_horizontal(0.0, 0.0,
+                                                            self.val['az'],
+                                                            self.val['el'],
+                                                            inverse=inverse)
+
+        np.testing.assert_allclose(self.out[4], self.val['el'], rtol=0,
+                                   atol=1.0e-12, err_msg="bad el")
         return
 
-    @pytest.mark.parametrize("kwargs,input,target",
-                             [({}, ['az', 'el', 'r'],
-                               ['x', 'y', 'z']),
-                              ({'inverse': False}, ['az', 'el', 'r'],
-                               ['x', 'y', 'z']),
-                              ({'inverse': True}, ['x', 'y', 'z'],
-                               ['az', 'el', 'r'])])
-    def test_spherical_to_cartesian(self, kwargs, input, target):
+
+class TestSphereCartesian(CoordTests):
+    """Unit tests for spherical/cartesian conversions."""
+
+    # Test inputs, shared by all tests and read-only to keep them unaltered
+    val = types.MappingProxyType({'az': 45.0, 'el': 30.0, 'r': 1.0,
+                                  'x': 0.6123724356957946,
+                                  'y': 0.6123724356957946,
+                                  'z': 0.5})
+
+    @pytest.mark.parametrize("nvals", _NVALS)
+    def test_spherical_to_cartesian(self, nvals):
         """Test conversion from spherical to cartesian coordinates."""
-        self.out = coords.spherical_to_cartesian(self.val[input[0]],
-                                                 self.val[input[1]],
-                                                 self.val[input[2]],
-                                                 **kwargs)
-
-        for i, self.loc in enumerate(self.out):
-            assert np.all(abs(self.loc - self.val[target[i]]) < 1.0e-6)
-            if isinstance(self.loc, np.ndarray):
-                assert self.loc.shape == self.val[input[0]].shape, \
-                    "mismatched output shape: {:} != {:}".format(
-                        self.loc.shape, self.val[input[0]].shape)
+        self.set_array_vals(nvals)
+        self.out = coords.spherical_to_cartesian(self.val['az'],
+                                                 self.val['el'],
+                                                 self.val['r'])
+
+        eval_stacked_output(self.out, [self.val['x'], self.val['y'],
+                                       self.val['z']], np.shape(self.val['az']))
         return
 
-    def test_spherical_to_cartesian_and_back(self):
-        """Test the reversibility of spherical to cartesian conversions."""
+    @pytest.mark.parametrize("nvals", _NVALS)
+    def test_spherical_to_cartesian_and_back(self, nvals):
+        """Test the reversibility of spherical to cartesian conversions.
+
+        Note
+        ----
+        Also tests the output of the inverse conversion with `inverse=True`
+
+        """
+        self.set_array_vals(nvals)
         self.out = coords.spherical_to_cartesian(self.val['x'], self.val['y'],
                                                  self.val['z'], inverse=True)
+        eval_stacked_output(self.out, [self.val['az'], self.val['el'],
+                                       self.val['r']], np.shape(self.val['x']))
+
         self.out = coords.spherical_to_cartesian(self.out[0], self.out[1],
                                                  self.out[2], inverse=False)
 
-        assert np.all(abs(self.val['x'] - self.out[0]) < 1.0e-6), "bad x"
-        assert np.all(abs(self.val['y'] - self.out[1]) < 1.0e-6), "bad y"
-        assert np.all(abs(self.val['z'] - self.out[2]) < 1.0e-6), "bad z"
-        return
-
-
-class TestSphereCartesianArray(TestSphereCartesian):
-    """Unit tests for spherical/cartesian coordinate conversion with arrays."""
-
-    def setup_method(self):
-        """Create a clean testing setup."""
-        arr = np.ones(shape=(10,), dtype=float)
-        self.val = {'az': 45.0 * arr, 'el': 30.0 * arr, 'r': 1.0 * arr,
-                    'x': 0.6123724356957946 * arr,
-                    'y': 0.6123724356957946 * arr,
-                    'z': 0.5 * arr}
-        self.out = None
-        self.loc = None
-        return
-
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
+        eval_stacked_output(self.out, [self.val['x'], self.val['y'],
+                                       self.val['z']], np.shape(self.val['x']))
         return
 
 
-class TestGlobalLocal(object):
+class TestGlobalLocal(CoordTests):
     """Unit tests for global/local conversions."""
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        self.val = {'x': 7000.0, 'y': 8000.0, 'z': 9000.0,
-                    'lat': 37.5, 'lon': 289.0, 'rad': 6380.0}
-        self.out = None
-        self.loc = None
-        return
-
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
-        return
+    # Test inputs, shared by all tests and read-only to keep them unaltered
+    val = types.MappingProxyType({'x': 7000.0, 'y': 8000.0, 'z': 9000.0,
+                                  'lat': 37.5, 'lon': 289.0, 'rad': 6380.0})
 
+    @pytest.mark.parametrize("nvals", _NVALS)
     @pytest.mark.parametrize("kwargs, target",
-                             [({},
-                               [9223.1752649, 10357.58863188, -5094.15562118]),
-                              ({'inverse': False},
-                               [9223.1752649, 10357.58863188, -5094.15562118]),
-                              ({'inverse': True},
-                               [9005.5925135, -4653.2653305, 15709.5775005])])
-    def test_global_to_local_cartesian(self, kwargs, target):
+                             [({}, _GLOBAL_LOCAL_FWD),
+                              ({'inverse': True}, _GLOBAL_LOCAL_INV)],
+                             ids=["default", "inverse"])
+    def test_global_to_local_cartesian(self, kwargs, target, nvals):
         """Test conversion from global to local cartesian coordinates."""
+        self.set_array_vals(nvals)
         self.out = coords.global_to_local_cartesian(self.val['x'],
                                                     self.val['y'],
                                                     self.val['z'],
@@ -239,16 +399,19 @@ class TestGlobalLocal(object):
                                                     self.val['rad'],
                                                     **kwargs)
 
-        for i, self.loc in enumerate(self.out):
-            assert np.all(abs(self.loc - target[i]) < 1.0e-6)
-            if isinstance(self.loc, np.ndarray):
-                assert self.loc.shape == self.val['x'].shape, \
-                    "shape mismatch: {:} != {:}".format(self.loc.shape,
-                                                        self.val['x'].shape)
+        eval_stacked_output(self.out, target, np.shape(self.val['x']))
         return
 
-    def test_global_to_local_cartesian_and_back(self):
-        """Test the reversibility of the global to loc cartesian transform."""
+    @pytest.mark.parametrize("nvals", _NVALS)
+    def test_global_to_local_cartesian_and_back(self, nvals):
+        """Test the reversibility of the global to loc cartesian transform.
+
+        Note
+        ----
+        Also tests the output of the forward conversion with `inverse=False`
+
+        """
+        self.set_array_vals(nvals)
         self.out = coords.global_to_local_cartesian(self.val['x'],
                                                     self.val['y'],
                                                     self.val['z'],
@@ -256,60 +419,35 @@ class TestGlobalLocal(object):
                                                     self.val['lon'],
                                                     self.val['rad'],
                                                     inverse=False)
+        eval_stacked_output(self.out, _GLOBAL_LOCAL_FWD,
+                            np.shape(self.val['x']))
+
         self.out = coords.global_to_local_cartesian(self.out[0], self.out[1],
                                                     self.out[2],
                                                     self.val['lat'],
                                                     self.val['lon'],
                                                     self.val['rad'],
                                                     inverse=True)
-        assert np.all(abs(self.val['x'] - self.out[0]) < 1.0e-6), "bad x"
-        assert np.all(abs(self.val['y'] - self.out[1]) < 1.0e-6), "bad y"
-        assert np.all(abs(self.val['z'] - self.out[2]) < 1.0e-6), "bad z"
-        return
-
-
-class TestGlobalLocalArray(TestGlobalLocal):
-    """Unit tests for global/local conversion with arrays."""
-
-    def setup_method(self):
-        """Create a clean testing setup."""
-        arr = np.ones(shape=(10,), dtype=float)
-        self.val = {'x': 7000.0 * arr, 'y': 8000.0 * arr, 'z': 9000.0 * arr,
-                    'lat': 37.5 * arr, 'lon': 289.0 * arr, 'rad': 6380.0 * arr}
-        self.out = None
-        self.loc = None
+        eval_stacked_output(self.out, [self.val['x'], self.val['y'],
+                                       self.val['z']], np.shape(self.val['x']))
         return
 
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
-        return
 
-
-class TestLocalHorizontalGlobal(object):
+class TestLocalHorizontalGlobal(CoordTests):
     """Tests for local horizontal to global geo and back."""
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        self.val = {'az': 30.0, 'el': 45.0, 'dist': 1000.0,
-                    'lat': 45.0, 'lon': 0.0, 'alt': 400.0}
-        self.out = None
-        self.loc = None
-        return
-
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
-        return
+    # Test inputs, shared by all tests and read-only to keep them unaltered
+    val = types.MappingProxyType({'az': 30.0, 'el': 45.0, 'dist': 1000.0,
+                                  'lat': 45.0, 'lon': 0.0, 'alt': 400.0})
 
+    @pytest.mark.parametrize("nvals", _NVALS)
     @pytest.mark.parametrize("kwargs,target",
-                             [({}, [49.62613564, 4.153673708, 7500.81015865]),
-                              ({'geodetic': True},
-                               [49.6261356, 4.153673708, 7500.81015865]),
-                              ({'geodetic': False},
-                               [49.60665778, 4.1652362, 7511.4633082])])
-    def test_local_horizontal_to_global_geo(self, kwargs, target):
+                             [({}, _LOCAL_GEODETIC),
+                              ({'geodetic': False}, _LOCAL_GEOCENTRIC)],
+                             ids=["default", "geocentric"])
+    def test_local_horizontal_to_global_geo(self, kwargs, target, nvals):
         """Tests the conversion of the local horizontal to global geo."""
+        self.set_array_vals(nvals)
         self.out = coords.local_horizontal_to_global_geo(self.val['az'],
                                                          self.val['el'],
                                                          self.val['dist'],
@@ -318,28 +456,77 @@ class TestLocalHorizontalGlobal(object):
                                                          self.val['alt'],
                                                          **kwargs)
 
-        for i, self.loc in enumerate(self.out):
-            assert np.all(abs(self.loc - target[i]) < 1.0e-6)
-            if isinstance(self.loc, np.ndarray):
-                assert self.loc.shape == self.val['lat'].shape, \
-                    "shape mismatch: {:} != {:}".format(self.loc.shape,
-                                                        self.val['lat'].shape)
+        eval_stacked_output(self.out, target, np.shape(self.val['lat']))
         return
 
+    @pytest.mark.parametrize("geodetic", [True, False])
+    def test_local_horizontal_to_global_geo_scalar_origin(self, geodetic):
+        """Test conversion of many points about a single, scalar origin.
 
-class TestLocalHorizontalGlobalArray(TestLocalHorizontalGlobal):
-    """Tests for local horizontal to global geo and back."""
+        Parameters
+        ----------
+        geodetic : bool
+            True if the origin is geodetic, False if it is geocentric
 
-    def setup_method(self):
-        """Create a clean testing setup."""
-        arr = np.ones(shape=(10,), dtype=float)
-        self.val = {'az': 30.0 * arr, 'el': 45.0 * arr, 'dist': 1000.0 * arr,
-                    'lat': 45.0 * arr, 'lon': 0.0 * arr, 'alt': 400.0 * arr}
-        self.out = None
-        self.loc = None
+        """
+        rng = np.random.default_rng(0)
+        nvals = 10000
+        pnts = {'az': rng.uniform(0.0, 360.0, nvals),
+                'el': rng.uniform(0.0, 90.0, nvals),
+                'dist': rng.uniform(100.0, 1000.0, nvals)}
+
+        # Convert all points in one call
+        self.out = coords.local_horizontal_to_global_geo(
+            pnts['az'], pnts['el'], pnts['dist'], self.val['lat'],
+            self.val['lon'], self.val['alt'], geodetic=geodetic)
+        assert np.shape(self.out) == (3, nvals), \
+            "unexpected output shape: {:}".format(np.shape(self.out))
+
+        # Compare a subset of the points to individual scalar conversions
+        isub = slice(0, nvals, nvals // 10)
+        target = [coords.local_horizontal_to_global_geo(
+            az, el, dist, self.val['lat'], self.val['lon'], self.val['alt'],
+            geodetic=geodetic) for az, el, dist in zip(
+                pnts['az'][isub], pnts['el'][isub], pnts['dist'][isub])]
+
+        eval_stacked_output(np.asarray(self.out)[:, isub],
+                            np.transpose(target), (len(target),))
         return
 
-    def teardown_method(self):
-        """Clean up previous testing."""
-        del self.val, self.out, self.loc
+    @pytest.mark.parametrize("el", [45.0, 89.9, 89.94, 90.0])
+    def test_local_horizontal_to_global_geo_float32(self, el):
+        """Test single precision inputs against double precision outputs.
+
+        Parameters
+        ----------
+        el : float
+            Elevation in degrees, including near-vertical pointing
+
+        """
+        # Use a JRO-like radar pointing, quantized to single precision
+        self.val = {'az': 6.2, 'el': el, 'dist': 778.0, 'lat': -11.95,
+                    'lon': -76.87, 'alt': 0.52}
+        self.val = {key: np.full(shape=(10,), fill_value=val, dtype=np.float32)
+                    for key, val in self.val.items()}
+        self.out = coords.local_horizontal_to_global_geo(self.val['az'],
+                                                         self.val['el'],
+                                                         self.val['dist'],
+                                                         self.val['lat'],
+                                                         self.val['lon'],
+                                                         self.val['alt'])
+
+        for out_val in self.out:
+            assert out_val.dtype == np.float32, \
+                "unexpected output precision: {:}".format(out_val.dtype)
+
+        # Calculate the same location in double precision
+        self.loc = coords.local_horizontal_to_global_geo(
+            *[self.val[key].astype(np.float64)
+              for key in ['az', 'el', 'dist', 'lat', 'lon', 'alt']])
+
+        # Single precision is good to about ten metres at Earth radius scales,
+        # or 1e-4 degrees in latitude and longitude
+        for i, atol in enumerate([1.0e-4, 1.0e-4, 1.0e-2]):
+            np.testing.assert_allclose(self.out[i], self.loc[i], rtol=0,
+                                       atol=atol)
         return